@@ -8,14 +8,109 @@ import sys
 import os
 from datetime import datetime
 import json
+import shutil
+from pathlib import Path
 from colorama import Fore, Style, init
 import platform
 import re
 import time
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson opsional - jauh lebih cepat untuk simpan JSON banyak device
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Initialize colorama
 init(autoreset=True)
 
+# Cek OS sekali saat load, bukan di setiap pemanggilan subprocess
+_IS_WINDOWS = platform.system() == "Windows"
+_CREATIONFLAGS = subprocess.CREATE_NO_WINDOW if _IS_WINDOWS else 0
+
+# Lokasi umum ADB yang dicoba check_adb_installed()
+_ADB_CANDIDATES = [
+    'adb',  # Jika sudah di PATH
+    os.path.join(os.getenv('ANDROID_HOME', ''), 'platform-tools', 'adb'),
+    os.path.join(os.getenv('ANDROID_SDK_ROOT', ''), 'platform-tools', 'adb'),
+    'platform-tools/adb',  # Relative path
+    './platform-tools/adb',  # Current directory
+    '../platform-tools/adb',  # Parent directory
+]
+
+# Untuk Windows
+if _IS_WINDOWS:
+    _ADB_CANDIDATES.extend([
+        'adb.exe',
+        'platform-tools\\adb.exe',
+        '.\\platform-tools\\adb.exe',
+        '..\\platform-tools\\adb.exe',
+        os.path.join(os.getcwd(), 'platform-tools', 'adb.exe'),
+        os.path.join(os.path.dirname(os.getcwd()), 'platform-tools', 'adb.exe'),
+    ])
+
+# Lokasi cache path ADB hasil deteksi
+_CONFIG_DIR = os.path.join(os.path.expanduser('~'), '.android_info_viewer')
+_ADB_CACHE_FILE = os.path.join(_CONFIG_DIR, 'adb.json')
+
+# File build.prop, fallback property ro.* yang tidak ada di getprop dump
+_BUILD_PROP_FILES = ['/system/build.prop', '/vendor/build.prop', '/odm/build.prop']
+
+# Satu baris output `getprop`: [key]: [value]
+_PROP_LINE_RE = re.compile(r'^\[([^\]]+)\]:\s*\[([^\]]*)\]\r?$', re.M)
+
+# Field `dumpsys battery` yang diambil (format per baris: "key: value")
+_BATTERY_FIELDS = {'level', 'scale', 'status', 'health', 'plugged', 'voltage',
+                   'temperature', 'technology', 'present', 'capacity'}
+
+# Battery: uevent sysfs dibaca langsung (tanpa dumpsys), dumpsys hanya fallback.
+# File `online` tiap power supply ikut dibaca untuk sumber daya (output "path:nilai")
+_BATTERY_CMD = ('cat /sys/class/power_supply/battery/uevent 2>/dev/null'
+                ' && { grep -sH "" /sys/class/power_supply/*/online; true; } || dumpsys battery')
+
+# Mapping nilai teks uevent ke kode angka versi dumpsys battery
+_BATTERY_STATUS_CODES = {'unknown': '1', 'charging': '2', 'discharging': '3', 'not charging': '4', 'full': '5'}
+_BATTERY_HEALTH_CODES = {'unknown': '1', 'good': '2', 'overheat': '3', 'dead': '4', 'over voltage': '5',
+                         'unspecified failure': '6', 'cold': '7'}
+# Power supply yang online ke kode `plugged` (sama dengan mapping Power Source)
+_PLUGGED_SUPPLY_CODES = {'ac': '1', 'usb': '2', 'wireless': '3'}
+_SUPPLY_ONLINE_RE = re.compile(r'^/sys/class/power_supply/([^/]+)/online:\s*(\d+)', re.M)
+
+# Regex total RAM dari /proc/meminfo
+_MEMTOTAL_RE = re.compile(r'MemTotal:\s+(\d+)')
+
+# Batas waktu total (detik) untuk mengambil info satu device
+_DEVICE_TIMEOUT = 15
+
+# Field info device yang selalu ada (diisi "Unknown" jika gagal/timeout)
+_INFO_FIELDS = ['serial_number', 'model_name', 'manufacturer', 'brand', 'device_name',
+                'product_name', 'android_version', 'api_level', 'build_number',
+                'security_patch', 'region_locale', 'country_code', 'cpu_architecture',
+                'kernel_version', 'uptime', 'screen_resolution', 'total_ram_gb',
+                'total_storage', 'root_status', 'usb_debugging', 'device_state',
+                'imei_last_4']
+
+# Pemisah antar section pada output collect_shell_bundle()
+_SECTION_MARKER = '===SECTION==='
+
+# Probe shell yang digabung jadi satu `adb shell` (urutan = index section)
+_SHELL_BUNDLE = [
+    'uname -m',
+    'uname -a',
+    'cat /proc/uptime',
+    'wm size',
+    'cat /proc/meminfo | grep MemTotal',
+    'df /data | tail -1',
+    'which su',
+    _BATTERY_CMD,
+    'service call iphonesubinfo 1 | grep -o "[0-9a-f]\\{8\\}" | head -n 1',
+]
+(_SEC_ARCH, _SEC_KERNEL, _SEC_UPTIME, _SEC_RESOLUTION, _SEC_MEMINFO,
+ _SEC_STORAGE, _SEC_SU, _SEC_BATTERY, _SEC_IMEI) = range(len(_SHELL_BUNDLE))
+
 class Color:
     """Warna untuk output"""
     HEADER = Fore.MAGENTA + Style.BRIGHT
@@ -26,111 +121,285 @@ class Color:
     INFO = Fore.BLUE
     RESET = Style.RESET_ALL
 
+# Potongan teks tampilan yang dipakai berulang
+_INFO_BULLET = f"{Color.INFO}• "
+_SEP40 = '-' * 40 + '\n'
+
+# Tabel warna battery, index = jumlah threshold yang terlewati
+_LEVEL_COLORS = (Color.ERROR, Color.WARNING, Color.SUCCESS)  # > 20%, > 50%
+_TEMP_COLORS = (Color.SUCCESS, Color.WARNING, Color.ERROR)   # > 35°C, > 40°C
+_HEALTH_COLORS = {'Good': Color.SUCCESS, 'Dead': Color.ERROR, 'Overheat': Color.ERROR}
+_STATUS_COLORS = {'Full': Color.SUCCESS, 'Charging': Color.WARNING}
+
+def _probe_adb(adb_path):
+    """Cek apakah adb_path bisa dijalankan (`adb --version`)"""
+    try:
+        result = subprocess.run([adb_path, '--version'], 
+                               capture_output=True, 
+                               text=True,
+                               creationflags=_CREATIONFLAGS)
+        return result.returncode == 0
+    except (FileNotFoundError, PermissionError):
+        return False
+
+def _load_cached_adb_path():
+    """Ambil path ADB dari cache jika file adb-nya belum berubah"""
+    try:
+        with open(_ADB_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        adb_path = cache['adb_path']
+        if os.path.exists(adb_path) and os.path.getmtime(adb_path) == cache['mtime']:
+            return adb_path
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+def _save_cached_adb_path(adb_path):
+    """Simpan path ADB yang ditemukan supaya run berikutnya tidak scan ulang"""
+    try:
+        os.makedirs(_CONFIG_DIR, exist_ok=True)
+        with open(_ADB_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'adb_path': adb_path, 'mtime': os.path.getmtime(adb_path)}, f)
+    except OSError:
+        pass
+
 def check_adb_installed():
     """Cek apakah ADB sudah terinstall dan bisa diakses"""
-    # Coba beberapa lokasi umum ADB
-    possible_adb_paths = [
-        'adb',  # Jika sudah di PATH
-        os.path.join(os.getenv('ANDROID_HOME', ''), 'platform-tools', 'adb'),
-        os.path.join(os.getenv('ANDROID_SDK_ROOT', ''), 'platform-tools', 'adb'),
-        'platform-tools/adb',  # Relative path
-        './platform-tools/adb',  # Current directory
-        '../platform-tools/adb',  # Parent directory
-    ]
-    
-    # Untuk Windows
-    if platform.system() == "Windows":
-        possible_adb_paths.extend([
-            'adb.exe',
-            'platform-tools\\adb.exe',
-            '.\\platform-tools\\adb.exe',
-            '..\\platform-tools\\adb.exe',
-            os.path.join(os.getcwd(), 'platform-tools', 'adb.exe'),
-            os.path.join(os.path.dirname(os.getcwd()), 'platform-tools', 'adb.exe'),
-        ])
+    # Coba path dari cache dulu - cukup satu kali probe
+    cached_path = _load_cached_adb_path()
+    if cached_path and _probe_adb(cached_path):
+        return True, cached_path
     
     # Coba setiap path
-    for adb_path in possible_adb_paths:
-        try:
-            result = subprocess.run([adb_path, '--version'], 
-                                   capture_output=True, 
-                                   text=True,
-                                   creationflags=subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0)
-            if result.returncode == 0:
-                return True, adb_path
-        except (FileNotFoundError, PermissionError):
-            continue
+    for adb_path in _ADB_CANDIDATES:
+        if _probe_adb(adb_path):
+            # Simpan path absolut supaya cache tetap valid walau cwd berbeda
+            _save_cached_adb_path(shutil.which(adb_path) or os.path.abspath(adb_path))
+            return True, adb_path
     
     return False, None
 
 def run_adb_command_safe(command, device_id=None, adb_path='adb'):
     """Jalankan command ADB dengan error handling yang lebih baik"""
     try:
-        # Untuk command shell, gunakan pendekatan berbeda
-        if '|' in command or '>' in command or 'cat' in command or 'grep' in command:
-            # Gunakan shell command dengan format yang benar
-            full_cmd = f'shell "{command}"'
-            cmd = [adb_path]
-            if device_id:
-                cmd.extend(['-s', device_id])
-            cmd.extend(full_cmd.split())
-            
-            result = subprocess.run(cmd, 
-                                   capture_output=True, 
-                                   text=True, 
-                                   timeout=10,
-                                   creationflags=subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0,
-                                   encoding='utf-8',
-                                   errors='ignore')
-            return result.stdout.strip()
-        else:
-            # Untuk command biasa
-            cmd = [adb_path]
-            if device_id:
-                cmd.extend(['-s', device_id])
-            cmd.extend(['shell', command])
-            
-            result = subprocess.run(cmd, 
-                                   capture_output=True, 
-                                   text=True, 
-                                   timeout=10,
-                                   creationflags=subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0,
-                                   encoding='utf-8',
-                                   errors='ignore')
-            return result.stdout.strip()
+        # Command dikirim utuh sebagai satu argumen; adb menjalankannya lewat `sh -c`
+        # di device, jadi pipe/redirect (|, >, grep, cat) langsung jalan tanpa quoting
+        cmd = [adb_path] + (['-s', device_id] if device_id else []) + ['shell', command]
+        
+        result = subprocess.run(cmd, 
+                               capture_output=True, 
+                               text=True, 
+                               timeout=10,
+                               creationflags=_CREATIONFLAGS,
+                               encoding='utf-8',
+                               errors='ignore')
+        return result.stdout.strip()
             
     except subprocess.TimeoutExpired:
         return "Timeout"
     except Exception as e:
         return f"Error: {str(e)}"
 
-def run_adb_command(command, device_id=None, adb_path='adb'):
+class AdbShell:
+    """Session `adb shell` persisten - satu proses adb untuk banyak command"""
+    
+    def __init__(self, device_id, adb_path='adb', deadline=None):
+        self.device_id = device_id
+        self.adb_path = adb_path
+        self._counter = 0
+        self._lines = queue.Queue()
+        self._proc = subprocess.Popen([adb_path, '-s', device_id, 'shell'],
+                                      stdin=subprocess.PIPE,
+                                      stdout=subprocess.PIPE,
+                                      stderr=subprocess.DEVNULL,
+                                      text=True,
+                                      bufsize=1,
+                                      encoding='utf-8',
+                                      errors='ignore',
+                                      creationflags=_CREATIONFLAGS)
+        # Baca stdout di thread terpisah supaya run() bisa pakai timeout
+        self._reader = threading.Thread(target=self._read_stdout, daemon=True)
+        self._reader.start()
+        # Device tanpa shell_v2 menjalankan shell di PTY yang meng-echo input dan menampilkan
+        # prompt; matikan keduanya dan tunggu sampai aktif sebelum command berikutnya dikirim
+        timeout = max(0.1, deadline - time.monotonic()) if deadline is not None else 10
+        try:
+            self.run('stty -echo 2>/dev/null; PS1=', timeout)
+        except Exception:
+            # Caller tidak dapat objek untuk di-close(), jadi proses adb dibereskan di sini
+            self._proc.kill()
+            self._proc.wait()
+            raise
+    
+    def _read_stdout(self):
+        for line in self._proc.stdout:
+            self._lines.put(line)
+        self._lines.put(None)  # EOF
+    
+    def _send(self, command):
+        """Tulis command + sentinel ke stdin session, return regex sentinel-nya"""
+        self._counter += 1
+        self._proc.stdin.write(f'{command}\necho __END__${{?}}__{self._counter}\n')
+        # Exit code di antara prefix dan counter: baris input yang ter-echo (masih berisi
+        # `${?}`) tidak akan cocok, hanya output echo yang sebenarnya
+        return re.compile(rf'__END__(\d+)__{self._counter}(?!\d)')
+    
+    def _read_until(self, marker, end_time):
+        """Baca stdout sampai sentinel marker muncul, return None jika waktu habis"""
+        output = []
+        while True:
+            try:
+                line = self._lines.get(timeout=max(0, end_time - time.monotonic()))
+            except queue.Empty:
+                # Session tidak sinkron lagi dengan sentinel, jangan dipakai ulang
+                self._proc.kill()
+                self._proc.wait()
+                return None
+            if line is None:
+                self._lines.put(None)  # Biar pembacaan berikutnya juga langsung EOF
+                break
+            # Output tanpa newline di akhir membuat sentinel nempel di baris yang sama
+            match = marker.search(line)
+            if match:
+                output.append(line[:match.start()])
+                break
+            output.append(line)
+        
+        return ''.join(output).strip()
+    
+    def run(self, command, timeout=10):
+        """Jalankan command di session, baca output sampai sentinel __END__"""
+        outputs, timed_out = self.run_many([command], timeout)
+        if timed_out:
+            raise subprocess.TimeoutExpired(command, timeout)
+        return outputs[0]
+    
+    def run_many(self, commands, timeout=10):
+        """Kirim semua command sekaligus (pipelined), lalu baca output masing-masing berurutan
+        
+        Return (outputs, timed_out). Jika waktu habis, output yang sudah diterima tetap
+        dikembalikan dan sisanya diisi "".
+        """
+        if self._proc.poll() is not None:
+            return [""] * len(commands), False
+        
+        try:
+            markers = [self._send(command) for command in commands]
+            self._proc.stdin.flush()
+        except (OSError, ValueError):
+            return [""] * len(commands), False
+        
+        end_time = time.monotonic() + timeout
+        outputs = []
+        for marker in markers:
+            output = self._read_until(marker, end_time)
+            if output is None:
+                return outputs + [""] * (len(markers) - len(outputs)), True
+            outputs.append(output)
+        return outputs, False
+    
+    def close(self):
+        """Tutup session adb shell"""
+        if self._proc.poll() is None:
+            try:
+                self._proc.stdin.write('exit\n')
+                self._proc.stdin.close()
+                self._proc.wait(timeout=2)
+            except Exception:
+                self._proc.kill()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def _deadline_passed(deadline):
+    """Cek apakah deadline bersama sudah lewat - fallback tidak perlu dicoba lagi"""
+    return deadline is not None and time.monotonic() >= deadline
+
+def run_adb_command(command, device_id=None, adb_path='adb', shell=None, deadline=None):
     """Jalankan command ADB - versi sederhana"""
+    # Dengan deadline bersama, timeout = sisa waktu sampai deadline
+    timeout = max(0.1, deadline - time.monotonic()) if deadline is not None else 10
     try:
+        # Pakai session persisten jika ada
+        if shell is not None:
+            return shell.run(command, timeout)
+        
         cmd = [adb_path]
         if device_id:
             cmd.extend(['-s', device_id])
         cmd.extend(['shell', command])
         
+        # Hanya stdout yang dipakai: stderr/stdin tidak perlu pipe, decode manual
+        # supaya tidak ada lapisan TextIOWrapper per command
         result = subprocess.run(cmd, 
-                               capture_output=True, 
-                               text=True, 
-                               timeout=10,
-                               creationflags=subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0,
-                               encoding='utf-8',
-                               errors='ignore')
-        return result.stdout.strip()
+                               stdout=subprocess.PIPE, 
+                               stderr=subprocess.DEVNULL, 
+                               stdin=subprocess.DEVNULL, 
+                               timeout=timeout,
+                               creationflags=_CREATIONFLAGS)
+        return result.stdout.decode('utf-8', 'ignore').strip()
+    except subprocess.TimeoutExpired:
+        # Deadline habis: biarkan pemanggil berhenti, jangan retry command lain
+        if deadline is not None:
+            raise
+        return ""
     except Exception as e:
         return ""
 
-def get_connected_devices(adb_path='adb'):
-    """Dapatkan list device yang terkoneksi"""
+def _adb_server_ready(adb_path='adb'):
+    """Cek cepat apakah adb server sudah jalan, return output `adb devices` atau None"""
     try:
         result = subprocess.run([adb_path, 'devices'], 
                                capture_output=True, 
                                text=True,
-                               creationflags=subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0)
-        output = result.stdout
+                               timeout=2,
+                               creationflags=_CREATIONFLAGS)
+        if result.returncode == 0 and 'List of devices' in result.stdout:
+            return result.stdout
+    except (subprocess.TimeoutExpired, OSError):
+        pass
+    return None
+
+def ensure_adb_server(adb_path='adb'):
+    """Pastikan adb server jalan - start (tanpa kill) hanya jika probe gagal
+    
+    Return output `adb devices` dari probe (bisa langsung dipakai get_connected_devices),
+    atau None jika server tidak merespon.
+    """
+    devices_output = _adb_server_ready(adb_path)
+    if devices_output is not None:
+        return devices_output
+    
+    try:
+        subprocess.run([adb_path, 'start-server'], 
+                       capture_output=True,
+                       timeout=10,
+                       creationflags=_CREATIONFLAGS)
+    except (subprocess.TimeoutExpired, OSError):
+        pass
+    
+    # Poll tiap 200 ms sampai server siap, maksimal 2 detik
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline:
+        devices_output = _adb_server_ready(adb_path)
+        if devices_output is not None:
+            return devices_output
+        time.sleep(0.2)
+    return None
+
+def get_connected_devices(adb_path='adb', output=None):
+    """Dapatkan list device yang terkoneksi"""
+    try:
+        # Pakai output `adb devices` yang sudah ada (dari probe server) jika diberikan
+        if output is None:
+            result = subprocess.run([adb_path, 'devices'], 
+                                   capture_output=True, 
+                                   text=True,
+                                   creationflags=_CREATIONFLAGS)
+            output = result.stdout
         devices = []
         
         if output:
@@ -145,34 +414,83 @@ def get_connected_devices(adb_path='adb'):
     except:
         return []
 
-def get_battery_info(device_id, adb_path='adb'):
+def collect_shell_bundle(device_id, adb_path='adb', shell=None, deadline=None):
+    """Jalankan semua probe shell dalam satu `adb shell`, return (sections, timed_out)"""
+    script = f'; echo {_SECTION_MARKER}; '.join(f'{{ {cmd}; }} 2>/dev/null' for cmd in _SHELL_BUNDLE)
+    timed_out = False
+    try:
+        output = run_adb_command(script, device_id, adb_path, shell, deadline)
+        sections = [section.strip() for section in output.split(_SECTION_MARKER)]
+    except subprocess.TimeoutExpired as e:
+        # Section yang sudah ditutup marker sebelum deadline tetap dipakai,
+        # potongan terakhir (command yang macet) dibuang
+        timed_out = True
+        partial = e.output or ''
+        if isinstance(partial, bytes):
+            partial = partial.decode('utf-8', 'ignore')
+        sections = [section.strip() for section in partial.split(_SECTION_MARKER)][:-1]
+    # Pastikan jumlah section selalu sesuai meski command gagal/timeout
+    sections += [''] * (len(_SHELL_BUNDLE) - len(sections))
+    return sections[:len(_SHELL_BUNDLE)], timed_out
+
+def _parse_battery_uevent(uevent_output):
+    """Parse /sys/class/power_supply/battery/uevent ke key yang sama dengan dumpsys battery"""
+    uevent = {}
+    for line in uevent_output.splitlines():
+        key, sep, value = line.strip().partition('=')
+        if sep:
+            uevent[key] = value.strip()
+    
+    battery_info = {}
+    if 'POWER_SUPPLY_CAPACITY' in uevent:
+        battery_info['level'] = uevent['POWER_SUPPLY_CAPACITY']
+        battery_info['scale'] = '100'
+    if 'POWER_SUPPLY_STATUS' in uevent:
+        battery_info['status'] = _BATTERY_STATUS_CODES.get(uevent['POWER_SUPPLY_STATUS'].lower(), '1')
+    if 'POWER_SUPPLY_HEALTH' in uevent:
+        battery_info['health'] = _BATTERY_HEALTH_CODES.get(uevent['POWER_SUPPLY_HEALTH'].lower(), '1')
+    if 'POWER_SUPPLY_VOLTAGE_NOW' in uevent:
+        # uevent dalam µV, dumpsys dalam mV
+        try:
+            battery_info['voltage'] = str(int(uevent['POWER_SUPPLY_VOLTAGE_NOW']) // 1000)
+        except ValueError:
+            pass
+    if 'POWER_SUPPLY_TEMP' in uevent:
+        battery_info['temperature'] = uevent['POWER_SUPPLY_TEMP']  # Sama-sama 0.1 °C
+    if 'POWER_SUPPLY_TECHNOLOGY' in uevent:
+        battery_info['technology'] = uevent['POWER_SUPPLY_TECHNOLOGY']
+    if 'POWER_SUPPLY_PRESENT' in uevent:
+        battery_info['present'] = 'true' if uevent['POWER_SUPPLY_PRESENT'] == '1' else 'false'
+    
+    online = [(name, value) for name, value in _SUPPLY_ONLINE_RE.findall(uevent_output)
+              if name in _PLUGGED_SUPPLY_CODES]
+    if online:
+        battery_info['plugged'] = next((_PLUGGED_SUPPLY_CODES[name] for name, value in online if value == '1'), '0')
+    
+    return battery_info
+
+def get_battery_info(device_id, adb_path='adb', battery_output=None, shell=None, deadline=None):
     """Dapatkan informasi battery lengkap dengan multiple methods"""
     battery_info = {}
     
-    # Method 1: dumpsys battery (standard method)
-    battery_output = run_adb_command('dumpsys battery', device_id, adb_path)
+    # Method 1: uevent sysfs, fallback ke dumpsys battery (standard method)
+    if battery_output is None:
+        battery_output = run_adb_command(_BATTERY_CMD, device_id, adb_path, shell, deadline)
     
     if battery_output and len(battery_output) > 10:
-        battery_info['raw_output'] = battery_output
-        
-        # Parse dengan regex yang lebih toleran
-        patterns = {
-            'level': r'level.*?:.*?(\d+)',
-            'scale': r'scale.*?:.*?(\d+)',
-            'status': r'status.*?:.*?(\d+)',
-            'health': r'health.*?:.*?(\d+)',
-            'plugged': r'plugged.*?:.*?(\d+)',
-            'voltage': r'voltage.*?:.*?(\d+)',
-            'temperature': r'temperature.*?:.*?(\d+)',
-            'technology': r'technology.*?:.*?(\w+)',
-            'present': r'present.*?:\s*(true|false)',
-            'capacity': r'capacity.*?:.*?(\d+)'
-        }
+        # Output mentah hanya disimpan untuk debugging, tidak ikut ke JSON biasa
+        if os.environ.get('ADIV_DEBUG'):
+            battery_info['raw_output'] = battery_output
         
-        for key, pattern in patterns.items():
-            match = re.search(pattern, battery_output, re.IGNORECASE)
-            if match:
-                battery_info[key] = match.group(1)
+        if 'POWER_SUPPLY_' in battery_output:
+            battery_info.update(_parse_battery_uevent(battery_output))
+        else:
+            # Parse satu kali jalan, per baris "key: value"
+            for line in battery_output.splitlines():
+                key, sep, value = line.strip().partition(':')
+                key = key.strip().lower()
+                if sep and key in _BATTERY_FIELDS:
+                    battery_info[key] = value.strip()
         
         # Calculate percentage
         if 'level' in battery_info and 'scale' in battery_info:
@@ -215,17 +533,16 @@ def get_battery_info(device_id, adb_path='adb'):
             except:
                 pass
     
-    # Method 2: Alternative battery info
-    if not battery_info:
+    # Method 2: Alternative battery info (tidak dicoba lagi jika deadline sudah lewat)
+    if not battery_info and not _deadline_passed(deadline):
         # Try alternative commands
         alt_commands = [
             'cat /sys/class/power_supply/battery/capacity',
-            'cat /sys/class/power_supply/batttery/uevent | grep CAPACITY',
             'dumpsys power | grep mBatteryLevel'
         ]
         
         for cmd in alt_commands:
-            result = run_adb_command(cmd, device_id, adb_path)
+            result = run_adb_command(cmd, device_id, adb_path, shell, deadline)
             if result and result.isdigit():
                 battery_info['level'] = result
                 battery_info['percentage'] = int(result)
@@ -233,15 +550,44 @@ def get_battery_info(device_id, adb_path='adb'):
     
     return battery_info
 
-def get_device_property(prop_name, device_id, adb_path='adb'):
-    """Dapatkan property dengan multiple fallback methods"""
-    # Method 1: Standard getprop
-    result = run_adb_command(f'getprop {prop_name}', device_id, adb_path)
-    
-    if result and result.strip() and "error" not in result.lower() and "not found" not in result.lower():
-        return result.strip()
+def parse_props(output):
+    """Parse output `getprop` menjadi dict {property: value}"""
+    # findall berjalan di dalam engine regex: tanpa split baris dan tanpa objek Match per baris
+    return dict(_PROP_LINE_RE.findall(output or ''))
+
+def get_build_props(device_id, adb_path='adb', shell=None, deadline=None):
+    """Baca build.prop system/vendor/odm sekali jalan, return dict {property: value}"""
+    output = run_adb_command(f'cat {" ".join(_BUILD_PROP_FILES)} 2>/dev/null', device_id, adb_path, shell, deadline)
+    build_props = {}
+    for line in output.splitlines():
+        line = line.strip()
+        if line and not line.startswith('#') and '=' in line:
+            key, value = line.split('=', 1)
+            # File yang dibaca lebih dulu (/system) diprioritaskan
+            build_props.setdefault(key.strip(), value.strip())
+    return build_props
+
+def collect_probes(device_id, adb_path='adb', shell=None, deadline=None):
+    """Ambil getprop dump dan semua section probe shell, return (props, sections, timed_out)"""
+    if shell is None:
+        # Yang sudah diterima sebelum deadline tetap dipakai
+        props, sections, timed_out = {}, [''] * len(_SHELL_BUNDLE), False
+        try:
+            props = parse_props(run_adb_command('getprop', device_id, adb_path, deadline=deadline))
+            sections, timed_out = collect_shell_bundle(device_id, adb_path, deadline=deadline)
+        except subprocess.TimeoutExpired:
+            timed_out = True
+    else:
+        # Session persisten: kirim semua probe sekaligus lalu baca hasilnya berurutan,
+        # jadi hanya satu round-trip tapi output tiap command tetap terpisah
+        timeout = max(0.1, deadline - time.monotonic()) if deadline is not None else 10
+        outputs, timed_out = shell.run_many(['getprop'] + [f'{{ {cmd}; }} 2>/dev/null' for cmd in _SHELL_BUNDLE], timeout)
+        props, sections = parse_props(outputs[0]), outputs[1:]
     
-    # Method 2: Try with different property names
+    return props, sections, timed_out
+
+def get_device_property(prop_name, props, build_props=None):
+    """Dapatkan property dari hasil getprop dump, dengan fallback nama alternatif"""
     alt_props = {
         'ro.serialno': ['ro.boot.serialno', 'ril.serialnumber', 'sys.serialnumber'],
         'ro.product.model': ['ro.product.model.name', 'ro.product.device.model'],
@@ -257,26 +603,17 @@ def get_device_property(prop_name, device_id, adb_path='adb'):
         'gsm.sim.operator.iso-country': ['ro.csc.country_code', 'ro.product.locale.region']
     }
     
-    if prop_name in alt_props:
-        for alt_prop in alt_props[prop_name]:
-            result = run_adb_command(f'getprop {alt_prop}', device_id, adb_path)
-            if result and result.strip() and "error" not in result.lower():
-                return result.strip()
-    
-    # Method 3: Try reading from build.prop
-    if not result:
-        build_prop = run_adb_command('cat /system/build.prop 2>/dev/null | grep -i "{}"'.format(prop_name.split('.')[-1]), device_id, adb_path)
-        if build_prop:
-            lines = build_prop.split('\n')
-            for line in lines:
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    if prop_name.split('.')[-1] in key.lower():
-                        return value.strip()
+    # Dump getprop sudah berisi semua property yang di-set, jadi cukup lookup dict;
+    # build.prop hanya terisi jika dump kosong (akses getprop dibatasi)
+    for source in (props or {}, build_props or {}):
+        for name in [prop_name] + alt_props.get(prop_name, []):
+            value = source.get(name, '').strip()
+            if value:
+                return value
     
     return None
 
-def get_device_info_enhanced(device_id, adb_path='adb'):
+def get_device_info_enhanced(device_id, adb_path='adb', shell=None, deadline=None):
     """Dapatkan informasi device dengan enhanced methods"""
     info = {
         'device_id': device_id,
@@ -284,6 +621,24 @@ def get_device_info_enhanced(device_id, adb_path='adb'):
         'status': 'connected'
     }
     
+    # Satu deadline untuk semua command device ini, bukan timeout per command
+    if deadline is None:
+        deadline = time.monotonic() + _DEVICE_TIMEOUT
+    
+    try:
+        _collect_device_fields(info, device_id, adb_path, shell, deadline)
+    except subprocess.TimeoutExpired:
+        info['status'] = 'timeout'
+    
+    # Field yang belum sempat terisi sebelum deadline dicatat "Unknown"
+    info.setdefault('battery', {})
+    for key in _INFO_FIELDS:
+        info.setdefault(key, "Unknown")
+    
+    return info
+
+def _collect_device_fields(info, device_id, adb_path, shell, deadline):
+    """Isi field info device, raise TimeoutExpired jika deadline terlewati"""
     # List of properties to get
     properties = [
         ('serial_number', 'ro.serialno'),
@@ -300,29 +655,39 @@ def get_device_info_enhanced(device_id, adb_path='adb'):
         ('country_code', 'gsm.sim.operator.iso-country')
     ]
     
-    # Get all properties
+    # Get all properties + probe shell lainnya - satu round-trip, lookup lokal
+    props, sections, timed_out = collect_probes(device_id, adb_path, shell, deadline)
+    if timed_out:
+        # Tetap parse output yang sempat diterima, field lain jadi "Unknown"
+        info['status'] = 'timeout'
+    
+    # build.prop hanya dibaca jika getprop dump kosong (mis. dibatasi SELinux/root)
+    build_props = {}
+    if not props and not _deadline_passed(deadline):
+        build_props = get_build_props(device_id, adb_path, shell, deadline)
+    
     for info_key, prop_name in properties:
-        value = get_device_property(prop_name, device_id, adb_path)
+        value = get_device_property(prop_name, props, build_props)
         info[info_key] = value if value else "Unknown"
     
     # Get battery info
-    battery_info = get_battery_info(device_id, adb_path)
+    battery_info = get_battery_info(device_id, adb_path, sections[_SEC_BATTERY], shell, deadline)
     info['battery'] = battery_info if battery_info else {}
     
     # Try alternative methods for other info
     # CPU Architecture
-    cpu = run_adb_command('getprop ro.product.cpu.abi', device_id, adb_path)
+    cpu = props.get('ro.product.cpu.abi', '')
     if not cpu or not cpu.strip():
-        cpu = run_adb_command('uname -m', device_id, adb_path)
+        cpu = sections[_SEC_ARCH]
     info['cpu_architecture'] = cpu.strip() if cpu and cpu.strip() else "Unknown"
     
     # Kernel version
-    kernel = run_adb_command('uname -a', device_id, adb_path)
-    info['kernel_version'] = kernel.strip() if kernel and kernel.strip() else "Unknown"
+    kernel = sections[_SEC_KERNEL]
+    info['kernel_version'] = kernel if kernel else "Unknown"
     
     # Uptime
-    uptime = run_adb_command('cat /proc/uptime 2>/dev/null', device_id, adb_path)
-    if uptime and uptime.strip():
+    uptime = sections[_SEC_UPTIME]
+    if uptime:
         try:
             uptime_seconds = float(uptime.split()[0])
             hours = int(uptime_seconds // 3600)
@@ -334,15 +699,15 @@ def get_device_info_enhanced(device_id, adb_path='adb'):
         info['uptime'] = "Unknown"
     
     # Screen resolution - try multiple methods
-    resolution = run_adb_command('wm size 2>/dev/null', device_id, adb_path)
-    if not resolution or not resolution.strip():
-        resolution = run_adb_command('dumpsys window displays 2>/dev/null | grep cur=', device_id, adb_path)
+    resolution = sections[_SEC_RESOLUTION]
+    if not resolution and not _deadline_passed(deadline):
+        resolution = run_adb_command('dumpsys window displays 2>/dev/null | grep cur=', device_id, adb_path, shell, deadline)
     info['screen_resolution'] = resolution.strip().replace("Physical size: ", "") if resolution and resolution.strip() else "Unknown"
     
     # RAM info
-    ram = run_adb_command('cat /proc/meminfo 2>/dev/null | grep MemTotal', device_id, adb_path)
-    if ram and ram.strip():
-        match = re.search(r'MemTotal:\s+(\d+)', ram)
+    ram = sections[_SEC_MEMINFO]
+    if ram:
+        match = _MEMTOTAL_RE.search(ram)
         if match:
             ram_kb = int(match.group(1))
             ram_gb = ram_kb / (1024 * 1024)
@@ -353,8 +718,8 @@ def get_device_info_enhanced(device_id, adb_path='adb'):
         info['total_ram_gb'] = "Unknown"
     
     # Storage info
-    storage = run_adb_command('df /data 2>/dev/null | tail -1', device_id, adb_path)
-    if storage and storage.strip():
+    storage = sections[_SEC_STORAGE]
+    if storage:
         parts = storage.split()
         if len(parts) >= 5:
             info['total_storage'] = parts[1]
@@ -367,42 +732,77 @@ def get_device_info_enhanced(device_id, adb_path='adb'):
         info['total_storage'] = "Unknown"
     
     # Root status
-    root_check = run_adb_command('which su 2>/dev/null', device_id, adb_path)
+    root_check = sections[_SEC_SU]
     info['root_status'] = "Rooted" if root_check and "/su" in root_check else "Not Rooted"
     
     # USB Debugging - check if we can run adb commands
     info['usb_debugging'] = "Enabled"  # Jika device terdeteksi, berarti USB debugging enabled
     
     # Device state
-    state = run_adb_command('getprop sys.boot_completed', device_id, adb_path)
+    state = props.get('sys.boot_completed', '')
     info['device_state'] = "Boot Completed" if state and state.strip() == "1" else "Unknown"
     
-    # IMEI - try multiple methods
-    imei_methods = [
-        'service call iphonesubinfo 1 2>/dev/null | grep -o "[0-9a-f]\\{8\\}" | head -n 1',
-        'dumpsys iphonesubinfo 2>/dev/null | grep Device',
-        'getprop gsm.device.id 2>/dev/null'
-    ]
-    
+    # IMEI - service call sudah ada di bundle, sisanya fallback
     imei_found = None
-    for imei_cmd in imei_methods:
-        imei = run_adb_command(imei_cmd, device_id, adb_path)
-        if imei and imei.strip() and len(imei.strip()) > 3:
-            imei_found = imei.strip()[:8]  # Take first 8 chars
-            break
+    imei = sections[_SEC_IMEI]
+    if imei and len(imei) > 3:
+        imei_found = imei[:8]  # Take first 8 chars
+    elif not _deadline_passed(deadline):
+        imei_methods = [
+            'dumpsys iphonesubinfo 2>/dev/null | grep Device',
+            'getprop gsm.device.id 2>/dev/null'
+        ]
+        
+        for imei_cmd in imei_methods:
+            imei = run_adb_command(imei_cmd, device_id, adb_path, shell, deadline)
+            if imei and imei.strip() and len(imei.strip()) > 3:
+                imei_found = imei.strip()[:8]  # Take first 8 chars
+                break
     
     info['imei_last_4'] = imei_found if imei_found else "Unknown"
+
+def collect_device_info(device_id, adb_path='adb'):
+    """Dapatkan informasi device dengan satu session adb shell (aman dipanggil dari thread)"""
+    # Deadline juga mencakup pembukaan session, termasuk jika harus fallback tanpa session
+    deadline = time.monotonic() + _DEVICE_TIMEOUT
+    try:
+        shell = AdbShell(device_id, adb_path, deadline)
+    except (OSError, subprocess.SubprocessError):
+        # Session gagal dibuka: tetap ambil info lewat adb per command
+        shell = None
     
-    return info
+    try:
+        return get_device_info_enhanced(device_id, adb_path, shell, deadline)
+    except Exception as e:
+        # Error satu device tidak boleh menggagalkan device lain di thread pool
+        info = {
+            'device_id': device_id,
+            'timestamp': datetime.now().isoformat(),
+            'status': f'error: {str(e)}',
+            'battery': {}
+        }
+        for key in _INFO_FIELDS:
+            info[key] = "Unknown"
+        return info
+    finally:
+        if shell is not None:
+            shell.close()
 
-def print_battery_info_enhanced(battery_info):
+def print_battery_info_enhanced(battery_info, out=None):
     """Tampilkan informasi battery dengan format yang bagus"""
+    # Tanpa buffer dari pemanggil, tulis sendiri sekali di akhir
+    if out is None:
+        out = []
+        print_battery_info_enhanced(battery_info, out)
+        sys.stdout.write("".join(out))
+        return
+    
     if not battery_info:
-        print(f"{Color.WARNING}⚠️ Battery: Information not available{Color.RESET}")
+        out.append(f"{Color.WARNING}⚠️ Battery: Information not available{Color.RESET}\n")
         return
     
-    print(f"\n{Color.TITLE}🔋 BATTERY INFORMATION{Color.RESET}")
-    print(f"{'-'*40}")
+    out.append(f"\n{Color.TITLE}🔋 BATTERY INFORMATION{Color.RESET}\n")
+    out.append(_SEP40)
     
     # Battery Level
     if 'percentage' in battery_info:
@@ -410,72 +810,75 @@ def print_battery_info_enhanced(battery_info):
         level_bar_length = 20
         filled = min(level_bar_length, int((percentage / 100) * level_bar_length))
         level_bar = "█" * filled + "░" * (level_bar_length - filled)
-        color = Color.SUCCESS if percentage > 50 else Color.WARNING if percentage > 20 else Color.ERROR
-        print(f"{Color.INFO}• Level:{Color.RESET}         {color}{percentage}%{Color.RESET}")
-        print(f"            {color}{level_bar}{Color.RESET}")
+        color = _LEVEL_COLORS[(percentage > 20) + (percentage > 50)]
+        out.append(f"{_INFO_BULLET}Level:{Color.RESET}         {color}{percentage}%{Color.RESET}\n")
+        out.append(f"            {color}{level_bar}{Color.RESET}\n")
     elif 'level' in battery_info:
         level = battery_info['level']
         scale = battery_info.get('scale', 100)
-        print(f"{Color.INFO}• Level:{Color.RESET}         {level}/{scale}")
+        out.append(f"{_INFO_BULLET}Level:{Color.RESET}         {level}/{scale}\n")
     
     # Battery Health
     if 'health_text' in battery_info:
         health = battery_info['health_text']
-        color = Color.SUCCESS if health == 'Good' else Color.ERROR if health in ['Dead', 'Overheat'] else Color.WARNING
-        print(f"{Color.INFO}• Health:{Color.RESET}        {color}{health}{Color.RESET}")
+        color = _HEALTH_COLORS.get(health, Color.WARNING)
+        out.append(f"{_INFO_BULLET}Health:{Color.RESET}        {color}{health}{Color.RESET}\n")
     
     # Battery Status
     if 'status_text' in battery_info:
         status = battery_info['status_text']
-        color = Color.SUCCESS if status == 'Full' else Color.WARNING if status == 'Charging' else Color.INFO
-        print(f"{Color.INFO}• Status:{Color.RESET}        {color}{status}{Color.RESET}")
+        color = _STATUS_COLORS.get(status, Color.INFO)
+        out.append(f"{_INFO_BULLET}Status:{Color.RESET}        {color}{status}{Color.RESET}\n")
     
     # Charging Source
     if 'plugged_text' in battery_info:
         plugged = battery_info['plugged_text']
-        print(f"{Color.INFO}• Power Source:{Color.RESET}  {plugged}")
+        out.append(f"{_INFO_BULLET}Power Source:{Color.RESET}  {plugged}\n")
     
     # Voltage
     if 'voltage_v' in battery_info:
         voltage = battery_info['voltage_v']
-        print(f"{Color.INFO}• Voltage:{Color.RESET}       {voltage} V")
+        out.append(f"{_INFO_BULLET}Voltage:{Color.RESET}       {voltage} V\n")
     
     # Temperature
     if 'temperature_c' in battery_info:
         temp = battery_info['temperature_c']
-        color = Color.ERROR if temp > 40 else Color.WARNING if temp > 35 else Color.SUCCESS
-        print(f"{Color.INFO}• Temperature:{Color.RESET}   {color}{temp}°C{Color.RESET}")
+        color = _TEMP_COLORS[(temp > 35) + (temp > 40)]
+        out.append(f"{_INFO_BULLET}Temperature:{Color.RESET}   {color}{temp}°C{Color.RESET}\n")
     
     # Technology
     if 'technology' in battery_info:
         tech = battery_info['technology']
-        print(f"{Color.INFO}• Technology:{Color.RESET}    {tech}")
+        out.append(f"{_INFO_BULLET}Technology:{Color.RESET}    {tech}\n")
 
 def print_device_info_enhanced(info, device_num=1, total_devices=1):
     """Tampilkan informasi device dengan format yang bagus"""
-    print(f"\n{Color.HEADER}{'='*60}")
-    print(f"DEVICE INFO - {device_num}/{total_devices}")
-    print(f"{'='*60}{Color.RESET}\n")
+    # Kumpulkan semua baris lalu tulis sekali ke stdout
+    out = []
+    # Tanpa autoreset per print, warna di-reset manual per baris
+    out.append(f"\n{Color.HEADER}{'='*60}{Color.RESET}\n")
+    out.append(f"DEVICE INFO - {device_num}/{total_devices}\n")
+    out.append(f"{Color.HEADER}{'='*60}{Color.RESET}\n\n")
     
     # Helper function untuk display dengan warna
-    def display_item(label, value):
-        if value == "Unknown" or value == "Tidak tersedia":
-            print(f"{Color.WARNING}• {label:20} {value}{Color.RESET}")
+    def display_item(label, value, warning=False):
+        if warning or value == "Unknown" or value == "Tidak tersedia":
+            out.append(f"{Color.WARNING}• {label:20} {value}{Color.RESET}\n")
         else:
-            print(f"{Color.INFO}• {label:20} {Color.SUCCESS}{value}{Color.RESET}")
+            out.append(f"{_INFO_BULLET}{label:20} {Color.SUCCESS}{value}{Color.RESET}\n")
     
     # Basic Info Section
-    print(f"{Color.TITLE}📱 BASIC INFORMATION{Color.RESET}")
-    print(f"{'-'*40}")
+    out.append(f"{Color.TITLE}📱 BASIC INFORMATION{Color.RESET}\n")
+    out.append(_SEP40)
     display_item("Device ID:", info['device_id'])
     display_item("Serial Number:", info['serial_number'])
-    display_item("Status:", info['status'])
+    display_item("Status:", info['status'], info['status'] != 'connected')
     display_item("Timestamp:", info['timestamp'][:19].replace('T', ' '))
     display_item("Uptime:", info.get('uptime', 'Unknown'))
     
     # Device Info Section
-    print(f"\n{Color.TITLE}📊 DEVICE SPECIFICATIONS{Color.RESET}")
-    print(f"{'-'*40}")
+    out.append(f"\n{Color.TITLE}📊 DEVICE SPECIFICATIONS{Color.RESET}\n")
+    out.append(_SEP40)
     display_item("Manufacturer:", info['manufacturer'])
     display_item("Brand:", info['brand'])
     display_item("Model Name:", info['model_name'])
@@ -483,8 +886,8 @@ def print_device_info_enhanced(info, device_num=1, total_devices=1):
     display_item("Product Name:", info['product_name'])
     
     # Android Info Section
-    print(f"\n{Color.TITLE}🤖 ANDROID INFORMATION{Color.RESET}")
-    print(f"{'-'*40}")
+    out.append(f"\n{Color.TITLE}🤖 ANDROID INFORMATION{Color.RESET}\n")
+    out.append(_SEP40)
     display_item("Android Version:", info['android_version'])
     display_item("API Level:", info['api_level'])
     display_item("Build Number:", info['build_number'])
@@ -492,25 +895,25 @@ def print_device_info_enhanced(info, device_num=1, total_devices=1):
     display_item("Kernel:", info.get('kernel_version', 'Unknown'))
     
     # Region & Location Section
-    print(f"\n{Color.TITLE}🌍 REGION & LOCATION{Color.RESET}")
-    print(f"{'-'*40}")
+    out.append(f"\n{Color.TITLE}🌍 REGION & LOCATION{Color.RESET}\n")
+    out.append(_SEP40)
     display_item("Region/Locale:", info['region_locale'])
     display_item("Country Code:", info['country_code'])
     
     # Print Battery Information
-    print_battery_info_enhanced(info.get('battery', {}))
+    print_battery_info_enhanced(info.get('battery', {}), out)
     
     # Hardware Info Section
-    print(f"\n{Color.TITLE}⚙️ HARDWARE INFORMATION{Color.RESET}")
-    print(f"{'-'*40}")
+    out.append(f"\n{Color.TITLE}⚙️ HARDWARE INFORMATION{Color.RESET}\n")
+    out.append(_SEP40)
     display_item("CPU Architecture:", info['cpu_architecture'])
     display_item("Total RAM:", f"{info.get('total_ram_gb', 'Unknown')} GB")
     display_item("Screen Resolution:", info['screen_resolution'])
     
     # Storage Info Section
     if info.get('total_storage') != "Unknown":
-        print(f"\n{Color.TITLE}💾 STORAGE INFORMATION{Color.RESET}")
-        print(f"{'-'*40}")
+        out.append(f"\n{Color.TITLE}💾 STORAGE INFORMATION{Color.RESET}\n")
+        out.append(_SEP40)
         display_item("Total Storage:", info.get('total_storage', 'Unknown'))
         display_item("Used Storage:", info.get('used_storage', 'Unknown'))
         display_item("Available Storage:", info.get('available_storage', 'Unknown'))
@@ -518,18 +921,23 @@ def print_device_info_enhanced(info, device_num=1, total_devices=1):
             display_item("Usage:", info['storage_use_percentage'])
     
     # Security Info Section
-    print(f"\n{Color.TITLE}🔒 SECURITY INFORMATION{Color.RESET}")
-    print(f"{'-'*40}")
+    out.append(f"\n{Color.TITLE}🔒 SECURITY INFORMATION{Color.RESET}\n")
+    out.append(_SEP40)
     display_item("Root Status:", info['root_status'])
     display_item("USB Debugging:", info['usb_debugging'])
     
     # Device State
-    print(f"\n{Color.TITLE}🔋 DEVICE STATE{Color.RESET}")
-    print(f"{'-'*40}")
+    out.append(f"\n{Color.TITLE}🔋 DEVICE STATE{Color.RESET}\n")
+    out.append(_SEP40)
     display_item("Device State:", info['device_state'])
     display_item("IMEI (last 4):", info.get('imei_last_4', 'Unknown'))
     
-    print(f"\n{Color.SUCCESS}✓ Device information retrieved successfully{Color.RESET}")
+    if info['status'] == 'connected':
+        out.append(f"\n{Color.SUCCESS}✓ Device information retrieved successfully{Color.RESET}\n")
+    else:
+        # Timeout/error: sebagian field mungkin "Unknown" karena belum sempat diambil
+        out.append(f"\n{Color.WARNING}⚠️ Device information incomplete ({info['status']}){Color.RESET}\n")
+    sys.stdout.write("".join(out))
 
 def main():
     """Fungsi utama"""
@@ -548,8 +956,8 @@ def main():
         
         # Try common locations
         common_paths = [
-            os.path.join(os.getcwd(), 'platform-tools', 'adb.exe' if platform.system() == "Windows" else 'adb'),
-            'adb.exe' if platform.system() == "Windows" else 'adb'
+            os.path.join(os.getcwd(), 'platform-tools', 'adb.exe' if _IS_WINDOWS else 'adb'),
+            'adb.exe' if _IS_WINDOWS else 'adb'
         ]
         
         for path in common_paths:
@@ -566,18 +974,15 @@ def main():
     
     print(f"{Color.SUCCESS}[✓] ADB ready: {adb_path}{Color.RESET}")
     
-    # Restart ADB
+    # Start ADB server hanya jika belum jalan
     print(f"{Color.INFO}[*] Initializing ADB...{Color.RESET}")
-    try:
-        subprocess.run([adb_path, 'kill-server'], capture_output=True)
-        subprocess.run([adb_path, 'start-server'], capture_output=True)
-        time.sleep(2)
-    except:
-        pass
+    devices_output = ensure_adb_server(adb_path)
+    if devices_output is None:
+        print(f"{Color.WARNING}[!] ADB server is not responding{Color.RESET}")
     
     # Check devices
     print(f"{Color.INFO}[*] Looking for connected devices...{Color.RESET}")
-    devices = get_connected_devices(adb_path)
+    devices = get_connected_devices(adb_path, devices_output)
     
     if not devices:
         print(f"{Color.WARNING}[!] No Android devices detected!{Color.RESET}")
@@ -600,15 +1005,14 @@ def main():
     
     print(f"{Color.SUCCESS}[✓] Found {len(devices)} device(s){Color.RESET}")
     
-    # Get info for each device
-    all_devices_info = []
-    for i, device_id in enumerate(devices, 1):
-        print(f"\n{Color.INFO}[*] Getting information for device {i}/{len(devices)}...{Color.RESET}")
-        print(f"{Color.INFO}[*] Device ID: {device_id}{Color.RESET}")
-        
-        # Get enhanced device info
-        info = get_device_info_enhanced(device_id, adb_path)
-        all_devices_info.append(info)
+    # Get info for all devices in parallel - tiap device punya endpoint USB sendiri
+    print(f"\n{Color.INFO}[*] Getting information for {len(devices)} device(s)...{Color.RESET}")
+    with ThreadPoolExecutor(max_workers=min(8, len(devices))) as executor:
+        all_devices_info = list(executor.map(lambda device_id: collect_device_info(device_id, adb_path), devices))
+    
+    # Display info berurutan setelah semua data terkumpul
+    for i, info in enumerate(all_devices_info, 1):
+        print(f"\n{Color.INFO}[*] Device ID: {info['device_id']}{Color.RESET}")
         
         # Display info
         print_device_info_enhanced(info, i, len(devices))
@@ -621,8 +1025,11 @@ def main():
                 model = info.get('model_name', 'unknown').replace(' ', '_').replace('/', '_')
                 filename = f"device_info_{model}_{timestamp}.json"
                 try:
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        json.dump(info, f, indent=2, ensure_ascii=False)
+                    if orjson is not None:
+                        Path(filename).write_bytes(orjson.dumps(info, option=orjson.OPT_INDENT_2))
+                    else:
+                        with open(filename, 'w', encoding='utf-8') as f:
+                            json.dump(info, f, indent=2, ensure_ascii=False)
                     print(f"{Color.SUCCESS}[✓] Saved to: {filename}{Color.RESET}")
                 except Exception as e:
                     print(f"{Color.ERROR}[!] Failed to save: {str(e)}{Color.RESET}")